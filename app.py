@@ -7,27 +7,33 @@ Each sales rep gets a unique link that tracks their submissions.
 """
 from __future__ import annotations
 
+import atexit
 import base64
 import hashlib
 import hmac
 import json
 import logging
+import math
 import os
 import re
 import smtplib
+import string
+import tempfile
 import threading
 import time
 import traceback
 import urllib.parse
 import urllib.request
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 from email.mime.application import MIMEApplication
+from email.policy import compat32
 from datetime import datetime
 from io import BytesIO
 from pathlib import Path
-from typing import List, Optional
+from typing import BinaryIO, List, Optional
 
 import socket as _socket
 
@@ -42,14 +48,17 @@ def _ipv4_only_getaddrinfo(*args, **kwargs):
 
 _socket.getaddrinfo = _ipv4_only_getaddrinfo
 
-from functools import wraps
+from functools import lru_cache, wraps
 
 from flask import (
-    Flask, request, redirect, url_for, render_template, jsonify,
-    send_from_directory, abort, session
+    Flask, Request, request, redirect, url_for, render_template,
+    abort, session
 )
 from werkzeug.security import check_password_hash
-from supabase import create_client, Client
+from werkzeug.utils import secure_filename
+from supabase import create_client, Client, ClientOptions
+import httpx
+import orjson
 from dotenv import load_dotenv, find_dotenv
 
 # PDF generation
@@ -58,11 +67,12 @@ try:
     from reportlab.lib.pagesizes import letter
     from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
     from reportlab.lib.units import inch
+    from reportlab.lib.utils import ImageReader
     from reportlab.platypus import (
-        SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle,
+        Paragraph, Spacer, Table, TableStyle,
         Image, HRFlowable, BaseDocTemplate, Frame, PageTemplate
     )
-    from reportlab.lib.enums import TA_CENTER, TA_RIGHT, TA_JUSTIFY
+    from reportlab.lib.enums import TA_JUSTIFY
     PDF_ENABLED = True
 except ImportError:
     PDF_ENABLED = False
@@ -139,17 +149,25 @@ def get_rep_info(rep_code: str, include_inactive: bool = False) -> Optional[dict
     """Get rep info by code, case-insensitive. Inactive reps are hidden by default."""
     if not rep_code:
         return None
-    rec = _get_reps_cached().get(rep_code.lower().strip())
+    reps = _get_reps_cached()
+    # Keys are already lowercase; rep links use them verbatim, so try the code
+    # as given before paying for a normalized copy.
+    rec = reps.get(rep_code) or reps.get(rep_code.lower().strip())
     if not rec:
         return None
     if not include_inactive and not rec.get("active", True):
         return None
     return {"name": rec["name"], "email": rec["email"]}
 
+_REP_SIG_KEY = os.environ.get("APP_SECRET", "dev-secret").encode()
+
+# Pure function of the code and a process-wide key, so memoize it: a handful
+# of reps sign on every / GET and /submit POST. Bounded because ?rep= is
+# attacker-controlled.
+@lru_cache(maxsize=256)
 def sign_rep_code(rep_code: str) -> str:
     """Generate HMAC signature to prevent rep_code tampering."""
-    key = (os.environ.get("APP_SECRET", "dev-secret")).encode()
-    return hmac.new(key, rep_code.lower().strip().encode(), hashlib.sha256).hexdigest()
+    return hmac.new(_REP_SIG_KEY, rep_code.lower().strip().encode(), hashlib.sha256).hexdigest()
 
 def verify_rep_code(rep_code: str, signature: str) -> bool:
     """Verify that rep_code has not been tampered with."""
@@ -158,28 +176,82 @@ def verify_rep_code(rep_code: str, signature: str) -> bool:
     expected = sign_rep_code(rep_code)
     return hmac.compare_digest(expected, signature)
 
-sb: Client = create_client(SUPABASE_URL, SUPABASE_SERVICE_ROLE)
+# One pooled HTTP client shared by PostgREST, Storage and Functions, with
+# bounded connection counts so bursts of submissions reuse keep-alive
+# connections instead of exhausting sockets. Don't run gunicorn with
+# --preload: each worker must build its own pool after fork.
+_sb_http = httpx.Client(
+    http2=True,
+    follow_redirects=True,
+    timeout=httpx.Timeout(120.0, connect=10.0),
+    limits=httpx.Limits(max_connections=20, max_keepalive_connections=10, keepalive_expiry=30),
+)
+sb: Client = create_client(SUPABASE_URL, SUPABASE_SERVICE_ROLE, options=ClientOptions(httpx_client=_sb_http))
 
 # ---- Supabase Storage helpers ------------------------------------------------
-def _upload_to_storage(file_data: bytes, bucket_path: str, content_type: str = "application/pdf") -> int:
-    """Upload file bytes to Supabase Storage. Returns size in bytes."""
+def _upload_to_storage(file_data, bucket_path: str, content_type: str = "application/pdf") -> int:
+    """Upload file bytes (or an unbuffered file, streamed from disk) to
+    Supabase Storage. Returns size in bytes."""
+    if isinstance(file_data, bytes):
+        size = len(file_data)
+    else:
+        size = os.fstat(file_data.fileno()).st_size
+        file_data.seek(0)
     sb.storage.from_(STORAGE_BUCKET).upload(
         path=bucket_path,
         file=file_data,
         file_options={"content-type": content_type, "x-upsert": "true"},
     )
-    return len(file_data)
+    return size
+
+_MAX_FILENAME = 120
+
+def _sanitize_filename(name: str) -> str:
+    """ASCII-only, separator-free storage name via secure_filename (path
+    separators become "_", leading dots are stripped; inner ".." may remain
+    but can't escape the prefix without a separator). Non-ASCII stems
+    ("выписка.pdf") would collapse to the bare extension, so those become
+    "file" + extension. Long names are trimmed to _MAX_FILENAME, keeping the
+    extension."""
+    safe = secure_filename(name)
+    ext = secure_filename(os.path.splitext(name)[1])  # ".pdf" -> "pdf"
+    if not safe or (ext and safe == ext):
+        safe = f"file.{ext}" if ext else "file"
+    if len(safe) > _MAX_FILENAME:
+        root, ext = os.path.splitext(safe)
+        ext = ext[:16]
+        safe = root[:_MAX_FILENAME - len(ext)] + ext
+    return safe
 
 def _download_from_storage(bucket_path: str) -> bytes:
     """Download file bytes from Supabase Storage."""
     return sb.storage.from_(STORAGE_BUCKET).download(bucket_path)
 
-def _get_signed_url(bucket_path: str, expires_in: int = SIGNED_URL_EXPIRY) -> str:
-    """Generate a time-limited signed URL for a private file."""
-    result = sb.storage.from_(STORAGE_BUCKET).create_signed_url(bucket_path, expires_in)
-    return result["signedURL"]
+def _get_signed_urls(bucket_paths: List[str], expires_in: int = SIGNED_URL_EXPIRY) -> dict:
+    """Sign many private files in one Storage call. Returns {path: url}; paths
+    Storage refuses to sign map to ""."""
+    if not bucket_paths:
+        return {}
+    items = sb.storage.from_(STORAGE_BUCKET).create_signed_urls(bucket_paths, expires_in)
+    return {it["path"]: ("" if it.get("error") else it["signedURL"]) for it in items}
+
+class _DiskSpoolRequest(Request):
+    """Spool every uploaded file part to an unbuffered temp file.
+
+    Werkzeug keeps parts under 500 KB in memory and wraps larger ones in a
+    SpooledTemporaryFile; neither can be handed to Storage as a stream. A raw
+    FileIO can, so uploads go disk → socket in chunks instead of being read
+    into memory whole.
+    """
+    def _get_file_stream(self, total_content_length, content_type, filename=None, content_length=None):
+        return tempfile.TemporaryFile("w+b", buffering=0)
+
+# Runs the per-file Storage uploads of a single /upload-docs request in
+# parallel so the request waits roughly one upload, not the sum of them.
+_upload_pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix="upload")
 
 app = Flask(__name__, static_folder="static", template_folder="templates")
+app.request_class = _DiskSpoolRequest
 app.secret_key = os.environ.get("APP_SECRET", "dev-secret")
 app.config["MAX_CONTENT_LENGTH"] = 100 * 1024 * 1024  # 100 MB upload cap
 
@@ -204,9 +276,41 @@ def admin_required(view):
 SSN_RE = re.compile(r'^(?!000|666|9\d\d)(\d{3})-(?!00)(\d{2})-(?!0000)(\d{4})$')
 EIN_RE = re.compile(r'^(?!00)\d{2}-\d{7}$')
 PHONE_RE = re.compile(r'^\+?1?\s*\(?\d{3}\)?[\s.-]*\d{3}[\s.-]*\d{4}$')
-ZIP_RE = re.compile(r'^\d{5}(-\d{4})?$')
 STATE_RE = re.compile(r'^[A-Za-z]{2}$')
-FICO_RE = re.compile(r'^\d{3}$')
+
+# Bound .match methods so the per-request validators skip the attribute lookup.
+_SSN_MATCH = SSN_RE.match
+_EIN_MATCH = EIN_RE.match
+_PHONE_MATCH = PHONE_RE.match
+
+# Every valid value is short; longer input is rejected before it reaches the
+# backtracking engine so junk submissions can't make matching blow up.
+# (RE2 would guarantee linear time but has no lookahead, which SSN/EIN need.)
+_MAX_PATTERN_INPUT = 32
+
+def _pattern_ok(match, value: str) -> bool:
+    return len(value) <= _MAX_PATTERN_INPUT and match(value) is not None
+
+def _is_valid_ssn(value: str) -> bool:
+    return _pattern_ok(_SSN_MATCH, value)
+
+def _is_valid_ein(value: str) -> bool:
+    return _pattern_ok(_EIN_MATCH, value)
+
+def _is_valid_phone(value: str) -> bool:
+    return _pattern_ok(_PHONE_MATCH, value)
+
+def _is_valid_zip(value: str) -> bool:
+    """##### or #####-####, checked by shape rather than through the regex engine."""
+    if len(value) == 5:
+        return value.isdecimal()
+    return (
+        len(value) == 10 and value[5] == "-"
+        and value[:5].isdecimal() and value[6:].isdecimal()
+    )
+
+# Every accepted score as a string: validation is a single hash lookup.
+_FICO_OK = frozenset(str(n) for n in range(300, 851))
 
 def _is_valid_fico(value: str) -> bool:
     """
@@ -215,18 +319,16 @@ def _is_valid_fico(value: str) -> bool:
     if value is None:
         return True
     v = value.strip()
-    if v == "":
-        return True
-    if not FICO_RE.match(v):
-        return False
-    try:
-        n = int(v)
-    except ValueError:
-        return False
-    return 300 <= n <= 850
+    return v == "" or v in _FICO_OK
 
 LOGO_PATH = APP_DIR / "static" / "pathway-logo.png"
 
+# Decode the logo once per process; every page of every PDF reuses the pixels.
+# getRGBData() is primed here so delivery threads never race on the lazy load.
+_LOGO = ImageReader(str(LOGO_PATH)) if PDF_ENABLED and LOGO_PATH.exists() else None
+if _LOGO is not None:
+    _LOGO.getRGBData()
+
 # Brand colours
 BRAND_BLUE = colors.HexColor('#1e40af')
 BRAND_LIGHT_BLUE = colors.HexColor('#3b82f6')
@@ -235,14 +337,70 @@ BRAND_BORDER = colors.HexColor('#bfdbfe')
 BRAND_DARK = colors.HexColor('#1e293b')
 BRAND_GRAY = colors.HexColor('#64748b')
 
+# Paragraph/table styles are read-only during a build, so one set is shared by
+# every PDF (and every delivery thread) instead of being rebuilt per call.
+_PDF_STYLES = getSampleStyleSheet()
+_SECTION_STYLE = ParagraphStyle(
+    'SectionHead', parent=_PDF_STYLES['Heading2'],
+    fontSize=13, spaceBefore=18, spaceAfter=8,
+    textColor=BRAND_BLUE, borderPadding=(0, 0, 4, 0),
+)
+_META_STYLE = ParagraphStyle(
+    'Meta', parent=_PDF_STYLES['Normal'],
+    fontSize=10, textColor=BRAND_GRAY, spaceAfter=2,
+)
+_AUTH_STYLE = ParagraphStyle(
+    'AuthText', parent=_PDF_STYLES['Normal'], fontSize=9, textColor=BRAND_GRAY,
+    spaceAfter=8, alignment=TA_JUSTIFY, leading=12,
+)
+_SIG_LABEL_STYLE = ParagraphStyle(
+    'SigLabel', parent=_PDF_STYLES['Normal'], fontSize=9, textColor=BRAND_GRAY
+)
+_SECTION_TABLE_STYLE = TableStyle([
+    ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
+    ('FONTNAME', (1, 0), (1, -1), 'Helvetica'),
+    ('FONTSIZE', (0, 0), (-1, -1), 10),
+    ('TEXTCOLOR', (0, 0), (0, -1), BRAND_DARK),
+    ('TEXTCOLOR', (1, 0), (1, -1), colors.HexColor('#334155')),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 7),
+    ('TOPPADDING', (0, 0), (-1, -1), 3),
+    ('LINEBELOW', (0, 0), (-1, -2), 0.25, BRAND_BORDER),
+    ('LINEBELOW', (0, -1), (-1, -1), 0.25, BRAND_BORDER),
+    ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+    ('BACKGROUND', (0, 0), (-1, -1), BRAND_BG),
+    ('LEFTPADDING', (0, 0), (-1, -1), 8),
+    ('RIGHTPADDING', (0, 0), (-1, -1), 8),
+    ('ROUNDEDCORNERS', [4, 4, 4, 4]),
+])
+_SECTION_COL_WIDTHS = [2.2*inch, 4.3*inch]
+
+# (label, form key) rows that the PDF prints verbatim, in display order.
+_BIZ_PLAIN_FIELDS = (
+    ("DBA Name", "business_dba"),
+    ("Industry", "industry"),
+    ("Legal Entity", "legal_entity"),
+    ("Business Start Date", "business_start_date"),
+    ("EIN", "ein"),
+    ("Website", "company_website"),
+)
+_PROP_FIELDS = (
+    ("Owns Real Estate", "own_real_estate"),
+    ("Own Home Location", "own_home_location"),
+    ("Own Business Location", "own_business_location"),
+)
+
+# Signature pads post a PNG data URL; the base64 body starts right after this.
+_PNG_DATA_URL = "data:image/png;base64,"
+_PNG_DATA_URL_LEN = len(_PNG_DATA_URL)
+
 def _pdf_header_footer(canvas, doc, submission_id):
     """Draw logo header, divider lines, and 'Powered by CROC' footer on every page."""
     canvas.saveState()
     w, h = letter
 
     # ── Header: logo + title ──
-    if LOGO_PATH.exists():
-        canvas.drawImage(str(LOGO_PATH), 0.6*inch, h - 1.05*inch, width=0.75*inch, height=0.75*inch, preserveAspectRatio=True, mask='auto')
+    if _LOGO is not None:
+        canvas.drawImage(_LOGO, 0.6*inch, h - 1.05*inch, width=0.75*inch, height=0.75*inch, preserveAspectRatio=True, mask='auto')
     canvas.setFont("Helvetica-Bold", 16)
     canvas.setFillColor(BRAND_BLUE)
     canvas.drawString(1.5*inch, h - 0.65*inch, "Pathway Catalyst")
@@ -278,25 +436,8 @@ def _pdf_header_footer(canvas, doc, submission_id):
 
 def _styled_section_table(data, col_widths=None):
     """Create a consistently styled two-column data table."""
-    if col_widths is None:
-        col_widths = [2.2*inch, 4.3*inch]
-    t = Table(data, colWidths=col_widths)
-    t.setStyle(TableStyle([
-        ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-        ('FONTNAME', (1, 0), (1, -1), 'Helvetica'),
-        ('FONTSIZE', (0, 0), (-1, -1), 10),
-        ('TEXTCOLOR', (0, 0), (0, -1), BRAND_DARK),
-        ('TEXTCOLOR', (1, 0), (1, -1), colors.HexColor('#334155')),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 7),
-        ('TOPPADDING', (0, 0), (-1, -1), 3),
-        ('LINEBELOW', (0, 0), (-1, -2), 0.25, BRAND_BORDER),
-        ('LINEBELOW', (0, -1), (-1, -1), 0.25, BRAND_BORDER),
-        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-        ('BACKGROUND', (0, 0), (-1, -1), BRAND_BG),
-        ('LEFTPADDING', (0, 0), (-1, -1), 8),
-        ('RIGHTPADDING', (0, 0), (-1, -1), 8),
-        ('ROUNDEDCORNERS', [4, 4, 4, 4]),
-    ]))
+    t = Table(data, colWidths=col_widths or _SECTION_COL_WIDTHS)
+    t.setStyle(_SECTION_TABLE_STYLE)
     return t
 
 
@@ -315,12 +456,17 @@ def _mask_mobile(mobile: str) -> str:
     return "7654562345"
 
 
-def generate_application_pdf(form_data: dict, submission_id: int, rep_name: str = None) -> BytesIO:
-    """Generate a professionally styled PDF summary of the application."""
+def generate_application_pdf(form_data: dict, submission_id: int, rep_name: str = None,
+                             out_stream: Optional[BinaryIO] = None) -> BinaryIO:
+    """Generate a professionally styled PDF summary of the application.
+
+    Renders into ``out_stream`` when given (any writable binary file), else
+    into a fresh BytesIO. The stream is returned rewound to the start.
+    """
     if not PDF_ENABLED:
         return None
 
-    buffer = BytesIO()
+    buffer = out_stream if out_stream is not None else BytesIO()
     w, h = letter
 
     # Custom page template with header/footer
@@ -333,60 +479,44 @@ def generate_application_pdf(form_data: dict, submission_id: int, rep_name: str
     doc = BaseDocTemplate(buffer, pagesize=letter, title=f"Application {submission_id}")
     doc.addPageTemplates([template])
 
-    styles = getSampleStyleSheet()
-
-    # Custom styles
-    section_style = ParagraphStyle(
-        'SectionHead', parent=styles['Heading2'],
-        fontSize=13, spaceBefore=18, spaceAfter=8,
-        textColor=BRAND_BLUE, borderPadding=(0, 0, 4, 0),
-    )
-    meta_style = ParagraphStyle(
-        'Meta', parent=styles['Normal'],
-        fontSize=10, textColor=BRAND_GRAY, spaceAfter=2,
-    )
-    consent_style = ParagraphStyle(
-        'Consent', parent=styles['Normal'],
-        fontSize=9, textColor=BRAND_GRAY, alignment=TA_CENTER, spaceBefore=20,
-    )
+    # One bound lookup for the ~50 field reads below; the values used more
+    # than once are read once.
+    get = form_data.get
+    business_name = get("business_legal_name", "")
+    second_owner = (get("has_owner_1") or "No").strip() == "Yes"
 
     elements = []
 
     # ── Submission meta info ──
-    elements.append(Paragraph(f"<b>Application ID:</b> {submission_id}", meta_style))
-    elements.append(Paragraph(f"<b>Submitted:</b> {datetime.now().strftime('%B %d, %Y at %I:%M %p')}", meta_style))
+    elements.append(Paragraph(f"<b>Application ID:</b> {submission_id}", _META_STYLE))
+    elements.append(Paragraph(f"<b>Submitted:</b> {datetime.now().strftime('%B %d, %Y at %I:%M %p')}", _META_STYLE))
     if rep_name:
-        elements.append(Paragraph(f"<b>Sales Representative:</b> {rep_name}", meta_style))
+        elements.append(Paragraph(f"<b>Sales Representative:</b> {rep_name}", _META_STYLE))
     elements.append(Spacer(1, 10))
     elements.append(HRFlowable(width="100%", thickness=0.5, color=BRAND_BORDER, spaceAfter=6))
 
     # ── Business Information ──
-    elements.append(Paragraph("Business Information", section_style))
-    loan_amt = form_data.get('loan_amount', '')
+    elements.append(Paragraph("Business Information", _SECTION_STYLE))
+    loan_amt = get('loan_amount', '')
     try:
         loan_display = f"${float(loan_amt):,.0f}" if loan_amt else ""
     except (ValueError, TypeError):
         loan_display = str(loan_amt)
 
-    biz_data = [
-        ["Business Legal Name", form_data.get("business_legal_name", "")],
-        ["DBA Name", form_data.get("business_dba", "")],
-        ["Industry", form_data.get("industry", "")],
-        ["Legal Entity", form_data.get("legal_entity", "")],
-        ["Business Start Date", form_data.get("business_start_date", "")],
-        ["EIN", form_data.get("ein", "")],
-        ["Website", form_data.get("company_website", "")],
-        ["Phone", _mask_mobile(form_data.get("business_phone", ""))],
+    biz_data = [["Business Legal Name", business_name]]
+    biz_data += [[label, get(key, "")] for label, key in _BIZ_PLAIN_FIELDS]
+    biz_data += [
+        ["Phone", _mask_mobile(get("business_phone", ""))],
         ["Requested Loan Amount", loan_display],
-        ["Loan Purpose", form_data.get("loan_purpose", "")],
+        ["Loan Purpose", get("loan_purpose", "")],
     ]
     elements.append(_styled_section_table(biz_data))
 
     # ── Company Address ──
-    elements.append(Paragraph("Company Address", section_style))
-    addr = f"{form_data.get('company_address1', '')} {form_data.get('company_address2', '')}".strip()
-    city_state = f"{form_data.get('company_city', '')}, {form_data.get('company_state', '')} {form_data.get('company_zip', '')}"
-    country = form_data.get('company_country', 'United States')
+    elements.append(Paragraph("Company Address", _SECTION_STYLE))
+    addr = f"{get('company_address1', '')} {get('company_address2', '')}".strip()
+    city_state = f"{get('company_city', '')}, {get('company_state', '')} {get('company_zip', '')}"
+    country = get('company_country', 'United States')
     addr_data = [
         ["Street", addr],
         ["City / State / ZIP", city_state],
@@ -395,67 +525,58 @@ def generate_application_pdf(form_data: dict, submission_id: int, rep_name: str
     elements.append(_styled_section_table(addr_data))
 
     # ── Primary Owner ──
-    elements.append(Paragraph("Primary Owner", section_style))
+    elements.append(Paragraph("Primary Owner", _SECTION_STYLE))
     owner_data = [
-        ["Name", f"{form_data.get('owner_0_first', '')} {form_data.get('owner_0_last', '')}"],
-        ["Ownership %", f"{form_data.get('owner_0_pct', '')}%"],
-        ["Date of Birth", form_data.get("owner_0_dob", "")],
-        ["SSN", form_data.get("owner_0_ssn", "")],
-        ["Email", _mask_email(form_data.get("owner_0_email", ""), form_data.get("business_legal_name", ""))],
-        ["Mobile", _mask_mobile(form_data.get("owner_0_mobile", ""))],
-        ["FICO Score", form_data.get("owner_0_fico", "N/A")],
-        ["MCA Balances", form_data.get("owner_0_mca_balances", "N/A")],
+        ["Name", f"{get('owner_0_first', '')} {get('owner_0_last', '')}"],
+        ["Ownership %", f"{get('owner_0_pct', '')}%"],
+        ["Date of Birth", get("owner_0_dob", "")],
+        ["SSN", get("owner_0_ssn", "")],
+        ["Email", _mask_email(get("owner_0_email", ""), business_name)],
+        ["Mobile", _mask_mobile(get("owner_0_mobile", ""))],
+        ["FICO Score", get("owner_0_fico", "N/A")],
+        ["MCA Balances", get("owner_0_mca_balances", "N/A")],
     ]
     elements.append(_styled_section_table(owner_data))
 
     # Owner home address
-    owner_addr = f"{form_data.get('owner_0_addr1', '')} {form_data.get('owner_0_addr2', '')}".strip()
-    owner_city_state = f"{form_data.get('owner_0_city', '')}, {form_data.get('owner_0_state', '')} {form_data.get('owner_0_zip', '')}"
-    elements.append(Paragraph("Owner Home Address", section_style))
+    owner_addr = f"{get('owner_0_addr1', '')} {get('owner_0_addr2', '')}".strip()
+    owner_city_state = f"{get('owner_0_city', '')}, {get('owner_0_state', '')} {get('owner_0_zip', '')}"
+    elements.append(Paragraph("Owner Home Address", _SECTION_STYLE))
     elements.append(_styled_section_table([
         ["Street", owner_addr],
         ["City / State / ZIP", owner_city_state],
     ]))
 
     # ── Second Owner (if present) ──
-    if (form_data.get("has_owner_1") or "No").strip() == "Yes":
-        elements.append(Paragraph("Second Owner", section_style))
+    if second_owner:
+        elements.append(Paragraph("Second Owner", _SECTION_STYLE))
         owner2_data = [
-            ["Name", f"{form_data.get('owner_1_first', '')} {form_data.get('owner_1_last', '')}"],
-            ["Ownership %", f"{form_data.get('owner_1_pct', '')}%"],
-            ["Date of Birth", form_data.get("owner_1_dob", "")],
-            ["SSN", form_data.get("owner_1_ssn", "")],
-            ["Email", _mask_email(form_data.get("owner_1_email", ""), form_data.get("business_legal_name", ""))],
-            ["Mobile", _mask_mobile(form_data.get("owner_1_mobile", ""))],
-            ["FICO Score", form_data.get("owner_1_fico", "N/A")],
-            ["MCA Balances", form_data.get("owner_1_mca_balances", "N/A")],
+            ["Name", f"{get('owner_1_first', '')} {get('owner_1_last', '')}"],
+            ["Ownership %", f"{get('owner_1_pct', '')}%"],
+            ["Date of Birth", get("owner_1_dob", "")],
+            ["SSN", get("owner_1_ssn", "")],
+            ["Email", _mask_email(get("owner_1_email", ""), business_name)],
+            ["Mobile", _mask_mobile(get("owner_1_mobile", ""))],
+            ["FICO Score", get("owner_1_fico", "N/A")],
+            ["MCA Balances", get("owner_1_mca_balances", "N/A")],
         ]
         elements.append(_styled_section_table(owner2_data))
 
         # Second owner home address
-        owner1_addr = f"{form_data.get('owner_1_addr1', '')} {form_data.get('owner_1_addr2', '')}".strip()
-        owner1_city_state = f"{form_data.get('owner_1_city', '')}, {form_data.get('owner_1_state', '')} {form_data.get('owner_1_zip', '')}"
-        elements.append(Paragraph("Second Owner Home Address", section_style))
+        owner1_addr = f"{get('owner_1_addr1', '')} {get('owner_1_addr2', '')}".strip()
+        owner1_city_state = f"{get('owner_1_city', '')}, {get('owner_1_state', '')} {get('owner_1_zip', '')}"
+        elements.append(Paragraph("Second Owner Home Address", _SECTION_STYLE))
         elements.append(_styled_section_table([
             ["Street", owner1_addr],
             ["City / State / ZIP", owner1_city_state],
         ]))
 
     # ── Property Information ──
-    elements.append(Paragraph("Property &amp; Location", section_style))
-    prop_data = [
-        ["Owns Real Estate", form_data.get("own_real_estate", "")],
-        ["Own Home Location", form_data.get("own_home_location", "")],
-        ["Own Business Location", form_data.get("own_business_location", "")],
-    ]
-    elements.append(_styled_section_table(prop_data))
+    elements.append(Paragraph("Property &amp; Location", _SECTION_STYLE))
+    elements.append(_styled_section_table([[label, get(key, "")] for label, key in _PROP_FIELDS]))
 
     # ── Signature & Authorization ──
-    elements.append(Paragraph("Authorization &amp; Signature", section_style))
-    auth_style = ParagraphStyle(
-        'AuthText', parent=styles['Normal'], fontSize=9, textColor=BRAND_GRAY,
-        spaceAfter=8, alignment=TA_JUSTIFY, leading=12,
-    )
+    elements.append(Paragraph("Authorization &amp; Signature", _SECTION_STYLE))
     elements.append(Paragraph(
         "By submitting this application, the applicant authorizes the lender and its partners to contact the "
         "applicant at the telephone, cell phone, email, or direct mail contact data provided in this form for "
@@ -468,88 +589,59 @@ def generate_application_pdf(form_data: dict, submission_id: int, rep_name: str
         "the applicant consents to the receipt of text messages knowing that message and data rates may apply. "
         "Reply STOP to unsubscribe, HELP for help. Message frequency varies. The applicant certifies that all "
         "the information contained herein is complete, true, and accurate.",
-        auth_style
+        _AUTH_STYLE
     ))
     elements.append(Paragraph(
         "<b>E-SIGN Act / UETA Consent:</b> The applicant agrees that the electronic digitized signature applied "
         "on this document is a representation of the applicant's signature and is legally valid and binding as "
         "if the applicant had signed the document with ink on paper in accordance with the Uniform Electronic "
         "Transactions Act (UETA) and the Electronic Signatures in Global and National Commerce Act (E-SIGN) of 2000.",
-        auth_style
+        _AUTH_STYLE
     ))
     elements.append(Spacer(1, 6))
 
     sig_info = [
-        ["Print Name", form_data.get("signature_print_name", "")],
-        ["Date Signed", form_data.get("signature_date", "")],
+        ["Print Name", get("signature_print_name", "")],
+        ["Date Signed", get("signature_date", "")],
     ]
     elements.append(_styled_section_table(sig_info))
 
     # Render hand signature image
-    sig_data = form_data.get("signature_data", "")
-    if sig_data and sig_data.startswith("data:image/png;base64,"):
-        raw = base64.b64decode(sig_data.split(",", 1)[1])
-        sig_buf = BytesIO(raw)
-        sig_img = Image(sig_buf, width=3.2*inch, height=1.2*inch)
+    sig_data = get("signature_data", "")
+    if sig_data and sig_data.startswith(_PNG_DATA_URL):
+        sig_img = Image(BytesIO(base64.b64decode(sig_data[_PNG_DATA_URL_LEN:])), width=3.2*inch, height=1.2*inch)
         sig_img.hAlign = 'LEFT'
         elements.append(Spacer(1, 8))
         elements.append(sig_img)
         elements.append(HRFlowable(width="50%", thickness=0.5, color=BRAND_DARK, spaceAfter=4))
-        elements.append(Paragraph("Applicant Signature", ParagraphStyle(
-            'SigLabel', parent=styles['Normal'], fontSize=9, textColor=BRAND_GRAY
-        )))
+        elements.append(Paragraph("Applicant Signature", _SIG_LABEL_STYLE))
 
     # Second-owner signature block (only if a second owner was added)
-    if (form_data.get("has_owner_1") or "No").strip() == "Yes":
+    if second_owner:
         elements.append(Spacer(1, 14))
         owner1_sig_info = [
-            ["Print Name", form_data.get("owner_1_signature_print_name", "")],
-            ["Date Signed", form_data.get("owner_1_signature_date", "")],
+            ["Print Name", get("owner_1_signature_print_name", "")],
+            ["Date Signed", get("owner_1_signature_date", "")],
         ]
         elements.append(_styled_section_table(owner1_sig_info))
 
-        owner1_sig_data = form_data.get("owner_1_signature_data", "")
-        if owner1_sig_data and owner1_sig_data.startswith("data:image/png;base64,"):
-            raw1 = base64.b64decode(owner1_sig_data.split(",", 1)[1])
-            sig_buf1 = BytesIO(raw1)
-            sig_img1 = Image(sig_buf1, width=3.2*inch, height=1.2*inch)
+        owner1_sig_data = get("owner_1_signature_data", "")
+        if owner1_sig_data and owner1_sig_data.startswith(_PNG_DATA_URL):
+            sig_img1 = Image(BytesIO(base64.b64decode(owner1_sig_data[_PNG_DATA_URL_LEN:])),
+                             width=3.2*inch, height=1.2*inch)
             sig_img1.hAlign = 'LEFT'
             elements.append(Spacer(1, 8))
             elements.append(sig_img1)
             elements.append(HRFlowable(width="50%", thickness=0.5, color=BRAND_DARK, spaceAfter=4))
-            elements.append(Paragraph("Second Owner Signature", ParagraphStyle(
-                'SigLabel2', parent=styles['Normal'], fontSize=9, textColor=BRAND_GRAY
-            )))
+            elements.append(Paragraph("Second Owner Signature", _SIG_LABEL_STYLE))
 
     doc.build(elements)
     buffer.seek(0)
     return buffer
 
 
-def _build_email_content(business_name, submission_id, rep_name, attached_files, email_type="new_application"):
-    """Build shared email HTML, plain text, and subject."""
-    rep_line = f"Referred by: {rep_name}" if rep_name else "Direct submission (no rep)"
-    doc_count = len(attached_files) if attached_files else 0
-    submitted = datetime.now().strftime('%B %d, %Y at %I:%M %p')
-    base_subject = f"New Application: {business_name} (ID: {submission_id})"
-    if email_type == "docs_update":
-        subject = f"Re: {base_subject}"
-        alert_text = "Additional Documents Uploaded"
-        attachments_text = f"{doc_count} supporting document(s)"
-        body_note = (
-            "The applicant has uploaded additional supporting documents for this application. "
-            "Please find them attached to this email."
-        )
-    else:
-        subject = base_subject
-        alert_text = "New Loan Application Received"
-        attachments_text = "Application PDF"
-        body_note = (
-            "Please find the complete application summary attached to this email. "
-            "You can also view full details in the admin dashboard."
-        )
-
-    html_body = f"""
+# Parsed once at import; only the placeholders are filled per send.
+_EMAIL_HTML = string.Template("""
 <!DOCTYPE html>
 <html>
 <head><meta charset="utf-8"></head>
@@ -574,7 +666,7 @@ def _build_email_content(business_name, submission_id, rep_name, attached_files,
             <table width="100%" cellpadding="0" cellspacing="0" style="background:#f0f7ff;border:1px solid #bfdbfe;border-radius:8px;margin-bottom:24px;">
               <tr>
                 <td style="padding:14px 18px;">
-                  <p style="margin:0;font-size:15px;font-weight:600;color:#1e40af;">{alert_text}</p>
+                  <p style="margin:0;font-size:15px;font-weight:600;color:#1e40af;">${alert_text}</p>
                 </td>
               </tr>
             </table>
@@ -583,28 +675,28 @@ def _build_email_content(business_name, submission_id, rep_name, attached_files,
             <table width="100%" cellpadding="0" cellspacing="0" style="margin-bottom:20px;">
               <tr>
                 <td style="padding:8px 0;border-bottom:1px solid #e2e8f0;color:#64748b;font-size:13px;width:140px;">Business</td>
-                <td style="padding:8px 0;border-bottom:1px solid #e2e8f0;color:#1e293b;font-size:14px;font-weight:600;">{business_name}</td>
+                <td style="padding:8px 0;border-bottom:1px solid #e2e8f0;color:#1e293b;font-size:14px;font-weight:600;">${business_name}</td>
               </tr>
               <tr>
                 <td style="padding:8px 0;border-bottom:1px solid #e2e8f0;color:#64748b;font-size:13px;">Application ID</td>
-                <td style="padding:8px 0;border-bottom:1px solid #e2e8f0;color:#1e293b;font-size:14px;font-weight:600;">{submission_id}</td>
+                <td style="padding:8px 0;border-bottom:1px solid #e2e8f0;color:#1e293b;font-size:14px;font-weight:600;">${submission_id}</td>
               </tr>
               <tr>
                 <td style="padding:8px 0;border-bottom:1px solid #e2e8f0;color:#64748b;font-size:13px;">Submitted</td>
-                <td style="padding:8px 0;border-bottom:1px solid #e2e8f0;color:#1e293b;font-size:14px;">{submitted}</td>
+                <td style="padding:8px 0;border-bottom:1px solid #e2e8f0;color:#1e293b;font-size:14px;">${submitted}</td>
               </tr>
               <tr>
                 <td style="padding:8px 0;border-bottom:1px solid #e2e8f0;color:#64748b;font-size:13px;">Representative</td>
-                <td style="padding:8px 0;border-bottom:1px solid #e2e8f0;color:#1e293b;font-size:14px;">{rep_line}</td>
+                <td style="padding:8px 0;border-bottom:1px solid #e2e8f0;color:#1e293b;font-size:14px;">${rep_line}</td>
               </tr>
               <tr>
                 <td style="padding:8px 0;color:#64748b;font-size:13px;">Attachments</td>
-                <td style="padding:8px 0;color:#1e293b;font-size:14px;">{attachments_text}</td>
+                <td style="padding:8px 0;color:#1e293b;font-size:14px;">${attachments_text}</td>
               </tr>
             </table>
 
             <p style="color:#475569;font-size:14px;line-height:1.6;margin:0 0 20px;">
-              {body_note}
+              ${body_note}
             </p>
 
           </td>
@@ -623,7 +715,37 @@ def _build_email_content(business_name, submission_id, rep_name, attached_files,
   </table>
 </body>
 </html>
-    """
+    """)
+
+
+def _build_email_content(business_name, submission_id, rep_name, attached_files, email_type="new_application"):
+    """Build shared email HTML, plain text, and subject."""
+    rep_line = f"Referred by: {rep_name}" if rep_name else "Direct submission (no rep)"
+    doc_count = len(attached_files) if attached_files else 0
+    submitted = datetime.now().strftime('%B %d, %Y at %I:%M %p')
+    base_subject = f"New Application: {business_name} (ID: {submission_id})"
+    if email_type == "docs_update":
+        subject = f"Re: {base_subject}"
+        alert_text = "Additional Documents Uploaded"
+        attachments_text = f"{doc_count} supporting document(s)"
+        body_note = (
+            "The applicant has uploaded additional supporting documents for this application. "
+            "Please find them attached to this email."
+        )
+    else:
+        subject = base_subject
+        alert_text = "New Loan Application Received"
+        attachments_text = "Application PDF"
+        body_note = (
+            "Please find the complete application summary attached to this email. "
+            "You can also view full details in the admin dashboard."
+        )
+
+    html_body = _EMAIL_HTML.substitute(
+        alert_text=alert_text, business_name=business_name, submission_id=submission_id,
+        submitted=submitted, rep_line=rep_line, attachments_text=attachments_text,
+        body_note=body_note,
+    )
 
     plain_text = (
         f"{alert_text}\n\nBusiness: {business_name}\n"
@@ -642,18 +764,18 @@ def _send_via_resend(to_emails, subject, html_body, plain_text, pdf_buffer, subm
 
     attachments = []
     if pdf_buffer:
-        pdf_buffer.seek(0)
         attachments.append({
             "filename": f"application_{submission_id}.pdf",
-            "content": base64.b64encode(pdf_buffer.read()).decode(),
+            "content": base64.b64encode(pdf_buffer.getbuffer()).decode(),
         })
     if attached_files:
         for bp in attached_files:
             try:
-                file_bytes = _download_from_storage(bp)
+                # Encode straight from the download so the raw bytes are
+                # freed before the next file is fetched.
                 attachments.append({
                     "filename": bp.split("/")[-1],
-                    "content": base64.b64encode(file_bytes).decode(),
+                    "content": base64.b64encode(_download_from_storage(bp)).decode(),
                 })
             except Exception as e:
                 log.error("Failed to download attachment %s: %s", bp, e)
@@ -690,11 +812,75 @@ def _send_via_resend(to_emails, subject, html_body, plain_text, pdf_buffer, subm
     return True
 
 
-def _send_via_smtp(to_emails, subject, html_body, plain_text, pdf_buffer, submission_id, attached_files,
-                   message_id=None, in_reply_to=None):
-    """Send email using SMTP (works locally, blocked on some cloud hosts)."""
-    log.info("Sending via SMTP to %s (%s:%s)", ', '.join(to_emails), SMTP_HOST, SMTP_PORT)
+# One authenticated SMTP session per delivery thread, reused across sends so
+# each email doesn't pay connect + STARTTLS + AUTH again. All sessions are
+# QUIT at exit.
+_smtp_local = threading.local()
+_smtp_sessions: list = []
+_smtp_sessions_lock = threading.Lock()
+
+
+def _open_smtp():
+    # Port 465 uses implicit SSL; port 587 uses STARTTLS
+    if SMTP_PORT == 465:
+        server = smtplib.SMTP_SSL(SMTP_HOST, SMTP_PORT, timeout=15)
+    else:
+        server = smtplib.SMTP(SMTP_HOST, SMTP_PORT, timeout=15)
+        server.starttls()
+    server.login(SMTP_USER, SMTP_PASS)
+    return server
+
 
+def _get_smtp():
+    """Return this thread's SMTP session, reconnecting if the NOOP probe fails."""
+    server = getattr(_smtp_local, "server", None)
+    if server is not None:
+        try:
+            if server.noop()[0] == 250:
+                return server
+        except (smtplib.SMTPException, OSError):
+            pass
+        _drop_smtp()
+    server = _open_smtp()
+    _smtp_local.server = server
+    with _smtp_sessions_lock:
+        _smtp_sessions.append(server)
+    return server
+
+
+def _drop_smtp():
+    server = getattr(_smtp_local, "server", None)
+    _smtp_local.server = None
+    if server is None:
+        return
+    with _smtp_sessions_lock:
+        if server in _smtp_sessions:
+            _smtp_sessions.remove(server)
+    try:
+        server.close()
+    except Exception:
+        pass
+
+
+def _quit_smtp_sessions():
+    with _smtp_sessions_lock:
+        sessions = list(_smtp_sessions)
+        _smtp_sessions.clear()
+    for server in sessions:
+        try:
+            server.quit()
+        except Exception:
+            pass
+
+
+# Registered before the delivery pool's shutdown hook, so (atexit being LIFO)
+# sessions are closed only after queued deliveries have drained.
+atexit.register(_quit_smtp_sessions)
+
+
+def _build_mime_message(to_emails, subject, html_body, plain_text, pdf_buffer, submission_id,
+                        attached_files, message_id=None, in_reply_to=None) -> MIMEMultipart:
+    """Assemble the full MIME tree (body + PDF + stored attachments) once."""
     msg = MIMEMultipart('mixed')
     msg['From'] = EMAIL_FROM
     msg['To'] = ', '.join(to_emails)
@@ -711,8 +897,9 @@ def _send_via_smtp(to_emails, subject, html_body, plain_text, pdf_buffer, submis
     msg.attach(alt_part)
 
     if pdf_buffer:
-        pdf_buffer.seek(0)
-        pdf_attachment = MIMEApplication(pdf_buffer.read(), _subtype='pdf')
+        # getbuffer() is a zero-copy view; MIMEApplication base64-encodes it
+        # in place of the payload, so the raw bytes are never duplicated.
+        pdf_attachment = MIMEApplication(pdf_buffer.getbuffer(), _subtype='pdf')
         pdf_attachment.add_header('Content-Disposition', 'attachment',
                                   filename=f'application_{submission_id}.pdf')
         msg.attach(pdf_attachment)
@@ -720,24 +907,53 @@ def _send_via_smtp(to_emails, subject, html_body, plain_text, pdf_buffer, submis
     if attached_files:
         for bp in attached_files:
             try:
-                file_bytes = _download_from_storage(bp)
-                file_attachment = MIMEApplication(file_bytes, _subtype='pdf')
+                file_attachment = MIMEApplication(_download_from_storage(bp), _subtype='pdf')
                 file_attachment.add_header('Content-Disposition', 'attachment',
                                           filename=bp.split("/")[-1])
                 msg.attach(file_attachment)
             except Exception as e:
                 log.error("Failed to download attachment %s for SMTP: %s", bp, e)
 
-    # Port 465 uses implicit SSL; port 587 uses STARTTLS
-    if SMTP_PORT == 465:
-        with smtplib.SMTP_SSL(SMTP_HOST, SMTP_PORT, timeout=15) as server:
-            server.login(SMTP_USER, SMTP_PASS)
-            server.send_message(msg)
-    else:
-        with smtplib.SMTP(SMTP_HOST, SMTP_PORT, timeout=15) as server:
-            server.starttls()
-            server.login(SMTP_USER, SMTP_PASS)
-            server.send_message(msg)
+    return msg
+
+
+# The MIME classes default to compat32, which serializes with bare LF; SMTP
+# DATA must be CRLF (RFC 5321), matching what send_message() would emit.
+_SMTP_WIRE_POLICY = compat32.clone(linesep="\r\n")
+
+
+def _smtp_wire_bytes(msg: MIMEMultipart) -> bytes:
+    """Serialize a message for SMTP DATA, CRLF-terminated."""
+    return msg.as_bytes(policy=_SMTP_WIRE_POLICY)
+
+
+def _smtp_deliver(raw: bytes, to_emails: List[str]):
+    """Send already-serialized message bytes over the thread's cached session.
+
+    Takes bytes rather than a Message so callers serialize once, however many
+    envelopes they send it in. ``raw`` must be CRLF-terminated (build it with
+    _smtp_wire_bytes): sendmail() only normalizes line endings for str data,
+    so plain ``msg.as_bytes()`` would put bare LFs on the wire.
+    """
+    try:
+        _get_smtp().sendmail(EMAIL_FROM, to_emails, raw)
+    except smtplib.SMTPServerDisconnected:
+        # Cached session went away between the NOOP probe and the send.
+        _drop_smtp()
+        _get_smtp().sendmail(EMAIL_FROM, to_emails, raw)
+
+
+def _send_via_smtp(to_emails, subject, html_body, plain_text, pdf_buffer, submission_id, attached_files,
+                   message_id=None, in_reply_to=None):
+    """Send email using SMTP (works locally, blocked on some cloud hosts)."""
+    log.info("Sending via SMTP to %s (%s:%s)", ', '.join(to_emails), SMTP_HOST, SMTP_PORT)
+
+    msg = _build_mime_message(
+        to_emails, subject, html_body, plain_text, pdf_buffer, submission_id, attached_files,
+        message_id=message_id, in_reply_to=in_reply_to,
+    )
+    # One serialization, one DATA transaction for every recipient.
+    _smtp_deliver(_smtp_wire_bytes(msg), to_emails)
 
     log.info("SMTP email sent successfully to %s", ', '.join(to_emails))
     return True
@@ -751,18 +967,18 @@ def _send_via_supabase_fn(to_emails, subject, html_body, plain_text, pdf_buffer,
 
     attachments = []
     if pdf_buffer:
-        pdf_buffer.seek(0)
         attachments.append({
             "filename": f"application_{submission_id}.pdf",
-            "content": base64.b64encode(pdf_buffer.read()).decode(),
+            "content": base64.b64encode(pdf_buffer.getbuffer()).decode(),
         })
     if attached_files:
         for bp in attached_files:
             try:
-                file_bytes = _download_from_storage(bp)
+                # Encode straight from the download so the raw bytes are
+                # freed before the next file is fetched.
                 attachments.append({
                     "filename": bp.split("/")[-1],
-                    "content": base64.b64encode(file_bytes).decode(),
+                    "content": base64.b64encode(_download_from_storage(bp)).decode(),
                 })
             except Exception as e:
                 log.error("Failed to download attachment %s: %s", bp, e)
@@ -870,6 +1086,37 @@ def send_email_with_pdf(
         return False
 
 
+# PDF rendering + email delivery run here, off the request thread. Bounded so
+# a burst of submissions queues instead of spawning a thread each; drained on
+# shutdown so a redeploy doesn't drop queued emails.
+_delivery_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="delivery")
+atexit.register(_delivery_pool.shutdown, wait=True)
+
+
+def _deliver_application(form: dict, submission_id: int, rep_info: Optional[dict], attached_files: List[str]):
+    """Generate the application PDF and email it to the team (+ rep). Never raises."""
+    try:
+        rep_name = rep_info["name"] if rep_info else None
+        log.info("Generating PDF for submission %s (rep=%s)", submission_id, rep_name)
+        pdf_buffer = generate_application_pdf(form, submission_id, rep_name)
+        if not pdf_buffer:
+            log.warning("PDF generation returned None for submission %s", submission_id)
+            return
+
+        recipients = [TEAM_EMAIL]
+        if rep_info and rep_info["email"]:
+            recipients.append(rep_info["email"])
+        ok = send_email_with_pdf(
+            to_emails=recipients, business_name=form.get("business_legal_name") or "",
+            pdf_buffer=pdf_buffer, submission_id=submission_id,
+            rep_name=rep_name, attached_files=attached_files,
+        )
+        if ok:
+            _mark_email_sent(submission_id, "initial_email_sent_at")
+    except Exception as e:
+        log.error("Failed to deliver application %s: %s\n%s", submission_id, e, traceback.format_exc())
+
+
 # ---- Business Lookup (SAM.gov) -----------------------------------------------
 
 def lookup_business_sam_gov(business_name: str, state_code: str, ein: str = "") -> dict:
@@ -969,109 +1216,172 @@ def lookup_business_sam_gov(business_name: str, state_code: str, ein: str = "")
     return result
 
 
+_REQ_FIELDS = (
+    'business_legal_name','industry','legal_entity','business_start_date','ein',
+    'company_address1','company_city','company_state','company_zip',
+    'owner_0_first','owner_0_last','owner_0_pct','owner_0_dob','owner_0_ssn','owner_0_email','owner_0_mobile',
+    'own_real_estate','own_home_location','own_business_location',
+    'esign_consent','esign_act_consent',
+    'signature_data','signature_date','signature_print_name',
+)
+
+# Required only when a second owner is added
+_OWNER1_REQ = (
+    'owner_1_first','owner_1_last','owner_1_pct','owner_1_dob','owner_1_ssn',
+    'owner_1_email','owner_1_mobile',
+    'owner_1_addr1','owner_1_city','owner_1_state','owner_1_zip',
+    'owner_1_signature_data','owner_1_signature_date','owner_1_signature_print_name',
+)
+
+# Format checks as (field, predicate, message), run in this order on non-blank
+# values; the order is the order errors are listed on the form.
+_FORMAT_CHECKS = (
+    ('ein', _is_valid_ein, 'Invalid EIN (##-#######)'),
+    ('owner_0_ssn', _is_valid_ssn, 'Invalid SSN (###-##-####)'),
+    ('owner_0_mobile', _is_valid_phone, 'Invalid phone number'),
+    ('company_zip', _is_valid_zip, 'Invalid ZIP'),
+    ('owner_0_fico', _is_valid_fico, 'FICO must be 300-850'),
+)
+
+# Checked only when a second owner is added
+_OWNER1_FORMAT_CHECKS = (
+    ('owner_1_fico', _is_valid_fico, 'FICO must be 300-850'),
+    ('owner_1_ssn', _is_valid_ssn, 'Invalid SSN (###-##-####)'),
+    ('owner_1_mobile', _is_valid_phone, 'Invalid phone number'),
+    ('owner_1_zip', _is_valid_zip, 'Invalid ZIP'),
+)
+
 def validate_fields(form: dict) -> dict:
     errors = {}
+    get = form.get  # bound once; called for every field below
+
+    # The consent checkbox is `required` in the browser, so a submission
+    # without it comes from a script; skip every other check for it.
+    if not get('esign_consent'):
+        return {'esign_consent': 'Required'}
 
     # Base required fields
-    req = [
-        'business_legal_name','industry','legal_entity','business_start_date','ein',
-        'company_address1','company_city','company_state','company_zip',
-        'owner_0_first','owner_0_last','owner_0_pct','owner_0_dob','owner_0_ssn','owner_0_email','owner_0_mobile',
-        'own_real_estate','own_home_location','own_business_location',
-        'esign_consent','esign_act_consent',
-        'signature_data','signature_date','signature_print_name',
-    ]
-    for k in req:
-        if not form.get(k):
+    for k in _REQ_FIELDS:
+        if not get(k):
             errors[k] = 'Required'
 
 
     # Second owner conditional required fields
-    has_owner_1 = (form.get('has_owner_1') or 'No').strip()
-    if has_owner_1 == 'Yes':
-        owner1_req = [
-            'owner_1_first','owner_1_last','owner_1_pct','owner_1_dob','owner_1_ssn',
-            'owner_1_email','owner_1_mobile',
-            'owner_1_addr1','owner_1_city','owner_1_state','owner_1_zip',
-            'owner_1_signature_data','owner_1_signature_date','owner_1_signature_print_name',
-        ]
-        for k in owner1_req:
-            if not form.get(k):
+    owner_1 = (get('has_owner_1') or 'No').strip() == 'Yes'
+    if owner_1:
+        for k in _OWNER1_REQ:
+            if not get(k):
                 errors[k] = 'Required'
 
-    # Pattern validations
-    if form.get('ein') and not EIN_RE.match(form['ein']):
-        errors['ein'] = 'Invalid EIN (##-#######)'
-
-    if form.get('owner_0_ssn') and not SSN_RE.match(form['owner_0_ssn']):
-        errors['owner_0_ssn'] = 'Invalid SSN (###-##-####)'
-
-    if form.get('owner_0_mobile') and not PHONE_RE.match(form['owner_0_mobile']):
-        errors['owner_0_mobile'] = 'Invalid phone number'
-
-    if form.get('company_zip') and not ZIP_RE.match(form['company_zip']):
-        errors['company_zip'] = 'Invalid ZIP'
-
-
-    # Owner 0 optional FICO validation
-    if not _is_valid_fico(form.get('owner_0_fico')):
-        errors['owner_0_fico'] = 'FICO must be 300-850'
-
-    # Owner 1 optional FICO validation (only if enabled)
-    if has_owner_1 == 'Yes' and not _is_valid_fico(form.get('owner_1_fico')):
-        errors['owner_1_fico'] = 'FICO must be 300-850'
-
-    # Owner 1 extra validations if enabled
-    if has_owner_1 == 'Yes':
-        if form.get('owner_1_ssn') and not SSN_RE.match(form['owner_1_ssn']):
-            errors['owner_1_ssn'] = 'Invalid SSN (###-##-####)'
-        if form.get('owner_1_mobile') and not PHONE_RE.match(form['owner_1_mobile']):
-            errors['owner_1_mobile'] = 'Invalid phone number'
-        if form.get('owner_1_zip') and not ZIP_RE.match(form['owner_1_zip']):
-            errors['owner_1_zip'] = 'Invalid ZIP'
+    # Format validations (blank values are left to the required checks)
+    for k, ok, msg in _FORMAT_CHECKS:
+        if (v := get(k)) and not ok(v):
+            errors[k] = msg
+    if owner_1:
+        for k, ok, msg in _OWNER1_FORMAT_CHECKS:
+            if (v := get(k)) and not ok(v):
+                errors[k] = msg
 
     # E-sign consent must be explicitly "Yes"
-    if form.get('esign_consent') and form.get('esign_consent') != 'Yes':
+    if get('esign_consent') != 'Yes':
         errors['esign_consent'] = 'Consent is required'
-    if form.get('esign_act_consent') and form.get('esign_act_consent') != 'Yes':
+    if (v := get('esign_act_consent')) and v != 'Yes':
         errors['esign_act_consent'] = 'Consent is required'
 
     return errors
 
 # -------------------- Public Pages --------------------
+# The landing page only varies by rep, apart from the per-session CSRF token.
+# Render once per (rep_code, rep name) with an unguessable placeholder where the
+# token goes, and splice the real token in per request.
+_CSRF_SLOT = uuid.uuid4().hex
+
+@lru_cache(maxsize=64)  # bounded: ?rep= is attacker-controlled
+def _home_page_parts(rep_code: str, rep_name: Optional[str]) -> tuple:
+    rep_info = {"name": rep_name} if rep_name is not None else None
+    rep_sig = sign_rep_code(rep_code) if rep_code else ""
+    html = render_template("form.html", rep_code=rep_code, rep_info=rep_info, rep_sig=rep_sig,
+                           csrf_token=lambda: _CSRF_SLOT)
+    head, _, tail = html.partition(_CSRF_SLOT)
+    return head, tail
+
 @app.route("/")
 def home():
     rep_code = request.args.get("rep", "").strip()
     rep_info = get_rep_info(rep_code)
-    rep_sig = sign_rep_code(rep_code) if rep_code else ""
-    return render_template("form.html", rep_code=rep_code, rep_info=rep_info, rep_sig=rep_sig)
+    if app.debug:  # pick up template edits without a restart
+        _home_page_parts.cache_clear()
+    # Keyed on the live rep name, so admin edits show up once the rep cache refreshes.
+    head, tail = _home_page_parts(rep_code, rep_info["name"] if rep_info else None)
+    return head + generate_csrf() + tail
+
+# business_legal_name never changes after insert, so reloads and back/forward
+# visits to /thank-you can skip the Supabase round-trip.
+_BUSINESS_NAME_TTL = 300  # seconds
+_BUSINESS_NAME_MAX = 4096
+_business_name_cache: dict = {}  # sid -> (expires_at, business_legal_name)
+_business_name_lock = threading.Lock()
+
+def _business_names_for(ids) -> dict:
+    """Map submission ids to business names: cache hits first, then one
+    .in_() query for every miss. Ids with no row are left out (and not cached)."""
+    now = time.time()
+    out, missing = {}, []
+    for sid in dict.fromkeys(ids):
+        hit = _business_name_cache.get(sid)
+        if hit is not None and now < hit[0]:
+            out[sid] = hit[1]
+        else:
+            missing.append(sid)
+    if not missing:
+        return out
+    res = sb.table("applications").select("id, business_legal_name").in_("id", missing).execute()
+    rows = res.data or []
+    expires_at = time.time() + _BUSINESS_NAME_TTL
+    with _business_name_lock:
+        if len(_business_name_cache) + len(rows) > _BUSINESS_NAME_MAX:
+            _business_name_cache.clear()
+        for row in rows:
+            business = row.get("business_legal_name")
+            out[row["id"]] = business
+            _business_name_cache[row["id"]] = (expires_at, business)
+    return out
+
+def _business_name_for(sid: int) -> Optional[str]:
+    return _business_names_for((sid,)).get(sid)
 
 @app.route("/thank-you")
 def thank_you():
     sid = request.args.get("sid", type=int)
     business = None
     if sid:
-        res = sb.table("applications").select("business_legal_name").eq("id", sid).limit(1).execute()
-        rows = res.data or []
-        if rows:
-            business = rows[0].get("business_legal_name")
+        # The redirect from /submit carries the name in the signed session, so
+        # the first view needs no lookup whichever worker serves it.
+        last = session.get("last_submission")
+        if last and last.get("sid") == sid:
+            business = last.get("business")
+        else:
+            business = _business_name_for(sid)
     return render_template("thank_you.html", sid=sid, business=business)
 
 # -------------------- Submission Endpoints --------------------
 @app.route("/submit", methods=["POST"])
 def submit():
-    # Normalize request.form into a clean dict
-    form = {k: (v.strip() if isinstance(v, str) else v) for k, v in request.form.items()}
+    # Normalize request.form into a clean dict. Form values are always str, so
+    # strip them with map() rather than a per-item isinstance check.
+    raw_form = request.form
+    form = dict(zip(raw_form.keys(), map(str.strip, raw_form.values())))
 
     # Get rep info from hidden field — verify HMAC to prevent tampering
-    rep_code = form.get("rep_code", "").strip()
-    rep_sig = form.get("rep_sig", "").strip()
+    rep_code = form.get("rep_code", "")
+    rep_sig = form.get("rep_sig", "")
     if rep_code and not verify_rep_code(rep_code, rep_sig):
         rep_code = ""  # reject tampered rep code
     rep_info = get_rep_info(rep_code)
 
-    # Enforce default for has_owner_1 if not present
-    if "has_owner_1" not in form or not form.get("has_owner_1"):
+    # Enforce default for has_owner_1 if missing or blank (setdefault alone
+    # would keep a submitted "").
+    if not form.get("has_owner_1"):
         form["has_owner_1"] = "No"
 
     # Normalize SSN/EIN: strip non-digits, re-insert dashes so validation works
@@ -1097,18 +1407,22 @@ def submit():
         loan_amount = float(form.get("loan_amount") or 0)
     except Exception:
         loan_amount = 0.0
+    # "nan"/"inf" parse as floats but the insert body is encoded with
+    # allow_nan=False, which would fail the whole request.
+    if not math.isfinite(loan_amount):
+        loan_amount = 0.0
 
     # Owners list (for dashboard display)
     owners: List[str] = []
-    first0 = (form.get("owner_0_first") or "").strip()
-    last0 = (form.get("owner_0_last") or "").strip()
+    # Values were stripped and has_owner_1 defaulted when form was built.
+    first0 = form.get("owner_0_first", "")
+    last0 = form.get("owner_0_last", "")
     if first0 or last0:
         owners.append((first0 + " " + last0).strip())
 
-    has_owner_1 = (form.get("has_owner_1") or "No").strip()
-    if has_owner_1 == "Yes":
-        first1 = (form.get("owner_1_first") or "").strip()
-        last1 = (form.get("owner_1_last") or "").strip()
+    if form["has_owner_1"] == "Yes":
+        first1 = form.get("owner_1_first", "")
+        last1 = form.get("owner_1_last", "")
         if first1 or last1:
             owners.append((first1 + " " + last1).strip())
 
@@ -1144,45 +1458,17 @@ def submit():
     if not ins.data:
         abort(500, description="Insert failed")
     submission_id = ins.data[0]["id"]
+    _invalidate_submissions_cache()
+    # The name is unbounded form input; cap it so the signed cookie stays well
+    # under the browser's ~4 KB limit (an oversized Set-Cookie is dropped).
+    session["last_submission"] = {"sid": submission_id, "business": business_legal_name[:200]}
 
     saved_paths: List[str] = []
 
-    # Generate PDF and email to team + rep (in background so user doesn't wait)
+    # PDF + email run on the delivery pool — user gets an instant redirect
     if PDF_ENABLED:
-        try:
-            rep_name = rep_info["name"] if rep_info else None
-            log.info("Generating PDF for submission %s (rep=%s)", submission_id, rep_name)
-            pdf_buffer = generate_application_pdf(form, submission_id, rep_name)
-
-            if pdf_buffer:
-                recipients = [TEAM_EMAIL]
-                if rep_info and rep_info["email"]:
-                    recipients.append(rep_info["email"])
-
-                # Send email in background thread — user gets instant redirect
-                def _bg_send(recips, biz, pdf_buf, sid, rname, files):
-                    try:
-                        ok = send_email_with_pdf(
-                            to_emails=recips, business_name=biz,
-                            pdf_buffer=pdf_buf, submission_id=sid,
-                            rep_name=rname, attached_files=files,
-                        )
-                        if ok:
-                            _mark_email_sent(sid, "initial_email_sent_at")
-                    except Exception as exc:
-                        log.error("Background email failed for %s: %s", sid, exc)
-
-                threading.Thread(
-                    target=_bg_send,
-                    args=(recipients, business_legal_name, pdf_buffer,
-                          submission_id, rep_name, saved_paths),
-                    daemon=True,
-                ).start()
-                log.info("Email queued in background for submission %s → %s", submission_id, recipients)
-            else:
-                log.warning("PDF generation returned None for submission %s", submission_id)
-        except Exception as e:
-            log.error("Failed to generate PDF for submission %s: %s\n%s", submission_id, e, traceback.format_exc())
+        _delivery_pool.submit(_deliver_application, form, submission_id, rep_info, saved_paths)
+        log.info("Application delivery queued for submission %s", submission_id)
     else:
         log.warning("PDF_ENABLED is False – reportlab not installed. Skipping PDF/email for submission %s", submission_id)
 
@@ -1197,31 +1483,34 @@ def upload_docs():
     saved = []
     attached_paths: List[str] = []
     failed: List[str] = []
+    # application_files rows for files already in Storage; inserted in one
+    # request below instead of one round-trip per file.
+    file_rows: List[dict] = []
+    stored_names: List[str] = []
 
     def _store_one(file_storage, dtype: str):
-        """Upload a single file with retry. Returns True on success, False on
-        failure (failure is logged but never raises so the batch continues)."""
+        """Upload a single file with retry. Returns its application_files row
+        on success, None on failure (failure is logged but never raises so the
+        batch continues)."""
         original = file_storage.filename or "file"
-        safe = original.replace("/", "_").replace("\\", "_")
+        safe = _sanitize_filename(original)
         # Unique prefix prevents filename collisions within a submission.
         unique = f"{uuid.uuid4().hex[:8]}_{safe}"
         bucket_path = f"{sid}/{dtype}/{unique}"
-        file_bytes = file_storage.read()
+        file_stream = file_storage.stream
         content_type = file_storage.content_type or "application/octet-stream"
 
         last_exc = None
         for attempt in range(3):
             try:
-                size = _upload_to_storage(file_bytes, bucket_path, content_type)
-                sb.table("application_files").insert({
+                size = _upload_to_storage(file_stream, bucket_path, content_type)
+                return {
                     "application_id": sid,
                     "filename": safe,
                     "storage_path": bucket_path,
                     "size_bytes": size,
                     "doc_type": dtype,
-                }).execute()
-                attached_paths.append(bucket_path)
-                return True
+                }
             except Exception as exc:
                 last_exc = exc
                 log.warning("Upload attempt %d failed for %s (%s): %s",
@@ -1229,24 +1518,50 @@ def upload_docs():
                 time.sleep(0.5)
 
         log.error("Upload failed after 3 attempts for %s (%s): %s", original, dtype, last_exc)
-        failed.append(original)
-        return False
+        return None
 
-    # Bank statements (multiple)
+    # Bank statements (multiple), then voided check + ID (single files).
+    # Storage uploads run concurrently; results are collected in form order.
+    uploads = []
     for f in request.files.getlist("bank_files"):
         if not f or not f.filename:
             continue
-        if _store_one(f, "bank_statement") and "bank_statement" not in saved:
-            saved.append("bank_statement")
-
-    # Voided check + ID (single files)
+        uploads.append((f.filename, "bank_statement", _upload_pool.submit(_store_one, f, "bank_statement")))
     for field, dtype in [("voided_check", "voided_check"), ("id_doc", "id_doc")]:
         f = request.files.get(field)
         if f and f.filename:
-            if _store_one(f, dtype):
-                saved.append(dtype)
+            uploads.append((f.filename, dtype, _upload_pool.submit(_store_one, f, dtype)))
+
+    for original, dtype, fut in uploads:
+        row = fut.result()
+        if row is None:
+            failed.append(original)
+            continue
+        file_rows.append(row)
+        stored_names.append(original)
+        attached_paths.append(row["storage_path"])
+        if dtype not in saved:
+            saved.append(dtype)
+
+    if file_rows:
+        last_exc = None
+        for attempt in range(3):
+            try:
+                sb.table("application_files").insert(file_rows).execute()
+                break
+            except Exception as exc:
+                last_exc = exc
+                log.warning("File metadata insert attempt %d failed for %s: %s",
+                            attempt + 1, sid, exc)
+                time.sleep(0.5)
+        else:
+            log.error("File metadata insert failed after 3 attempts for %s: %s", sid, last_exc)
+            failed.extend(stored_names)
+            saved.clear()
+            attached_paths.clear()
+        _invalidate_detail(sid)
 
-    # Email uploaded documents to team + rep (in background)
+    # Email uploaded documents to team + rep (on the delivery pool)
     if attached_paths:
         try:
             app_res = sb.table("applications").select(
@@ -1274,11 +1589,7 @@ def upload_docs():
                 except Exception as exc:
                     log.error("Background docs email failed for %s: %s", sid_, exc)
 
-            threading.Thread(
-                target=_bg_send_docs,
-                args=(recipients, business_name, sid, rep_name, attached_paths),
-                daemon=True,
-            ).start()
+            _delivery_pool.submit(_bg_send_docs, recipients, business_name, sid, rep_name, attached_paths)
             log.info("Docs email queued for submission %s → %s", sid, recipients)
         except Exception as e:
             log.error("Failed to queue docs email for %s: %s", sid, e)
@@ -1286,27 +1597,102 @@ def upload_docs():
     return render_template("thank_you.html", sid=sid, uploaded=saved, failed=failed)
 
 # -------------------- JSON APIs for Dashboard --------------------
-@app.route("/api/submissions")
-@admin_required
-def api_submissions():
+def _json_response(data, status: int = 200):
+    """Serialize with orjson straight to bytes (much faster than jsonify on big pages)."""
+    return app.response_class(orjson.dumps(data), status=status, mimetype="application/json")
+
+# The dashboard re-polls the same unfiltered pages; within a worker, polls that
+# land inside the TTL share one Supabase fetch and one JSON encode.
+_SUBMISSIONS_CACHE_TTL = 2  # seconds
+_SUBMISSIONS_CACHE_MAX = 32
+_submissions_cache: dict = {}  # (limit, offset) -> (expires_at, etag, body)
+_submissions_cache_lock = threading.Lock()
+
+def _get_cached_submissions_page(key) -> Optional[tuple]:
+    """Return (etag, body) for a fresh cached page, else None."""
+    hit = _submissions_cache.get(key)
+    if hit is not None and time.time() < hit[0]:
+        return hit[1], hit[2]
+    return None
+
+def _store_submissions_page(key, etag: str, body: bytes) -> None:
+    with _submissions_cache_lock:
+        if len(_submissions_cache) >= _SUBMISSIONS_CACHE_MAX:
+            _submissions_cache.clear()
+        _submissions_cache[key] = (time.time() + _SUBMISSIONS_CACHE_TTL, etag, body)
+
+def _invalidate_submissions_cache() -> None:
+    with _submissions_cache_lock:
+        _submissions_cache.clear()
+
+# Opening, closing and reopening a row in the dashboard re-requests the same
+# detail; cache the encoded response per sid. Signed URLs outlive the TTL by
+# far. The cache is per worker and /upload-docs only clears the worker that
+# handled it, so a hit is revalidated against the sid's file fingerprint
+# (one tiny query) before it is served; files added via any worker show up
+# on the next view.
+_DETAIL_CACHE_TTL = 30  # seconds
+_DETAIL_CACHE_MAX = 512
+_detail_cache: dict = {}  # sid -> (expires_at, files_fingerprint, body)
+_detail_cache_lock = threading.Lock()
+
+def _get_cached_detail(sid: int) -> Optional[tuple]:
+    """Return (files_fingerprint, body) for a fresh cached detail, else None."""
+    hit = _detail_cache.get(sid)
+    if hit is not None and time.time() < hit[0]:
+        return hit[1], hit[2]
+    return None
+
+def _store_detail(sid: int, fingerprint: str, body: bytes) -> None:
+    with _detail_cache_lock:
+        if len(_detail_cache) >= _DETAIL_CACHE_MAX:
+            _detail_cache.clear()
+        _detail_cache[sid] = (time.time() + _DETAIL_CACHE_TTL, fingerprint, body)
+
+def _files_fingerprint(max_id: int, count: int) -> str:
+    return f"{max_id}-{count}"
+
+def _current_files_fingerprint(sid: int) -> str:
+    """Newest file id + file count for a submission, from a one-row query.
+
+    application_files is insert-only from the app, so the file list only
+    changes when a row is added (max id moves) or removed (count drops).
+    """
+    res = sb.table("application_files").select("id", count="exact").eq(
+        "application_id", sid
+    ).order("id", desc=True).limit(1).execute()
+    return _files_fingerprint(res.data[0]["id"] if res.data else 0, res.count or 0)
+
+def _invalidate_detail(sid: int) -> None:
+    with _detail_cache_lock:
+        _detail_cache.pop(sid, None)
+
+def _submissions_etag(limit: int, offset: int) -> str:
+    """Fingerprint of an unfiltered page: newest id + row count, from a one-row query.
+
+    Applications are insert-only from the app, so a page only changes when
+    a row is added (max id moves) or removed (count drops).
+    """
+    res = sb.table("applications").select("id", count="exact").order("id", desc=True).limit(1).execute()
+    max_id = res.data[0]["id"] if res.data else 0
+    return f"{max_id}-{res.count or 0}-{limit}-{offset}"
+
+def _list_paging_args(default_limit: int, max_limit: int) -> tuple:
     try:
-        limit = int(request.args.get("limit", "100"))
+        limit = int(request.args.get("limit", str(default_limit)))
         offset = int(request.args.get("offset", "0"))
     except ValueError:
-        limit, offset = 100, 0
-    limit = max(1, min(limit, 1000))
-    offset = max(0, offset)
+        limit, offset = default_limit, 0
+    return max(1, min(limit, max_limit)), max(0, offset)
 
-    rep_filter = request.args.get("rep", "").strip()
-    q = request.args.get("q", "").strip()
+# The list view only renders these; payload (the whole form) is fetched per
+# row from the detail endpoint when an application is opened.
+_SUBMISSION_LIST_COLUMNS = "id, created_at, business_legal_name, industry, loan_amount, owners, rep_name"
+_SUBMISSION_DETAIL_COLUMNS = "id, created_at, business_legal_name, industry, loan_amount, owners, payload, company_website, rep_name, rep_email"
 
-    start = offset
-    end = offset + limit - 1
-
-    query = sb.table("applications").select(
-        "id, created_at, business_legal_name, industry, loan_amount, owners, payload, company_website, rep_name, rep_email",
-        count="exact",
-    )
+def _submissions_page_query(rep_filter: str, q: str, columns: str = _SUBMISSION_LIST_COLUMNS):
+    """Newest-first applications query with the dashboard's rep/search filters applied."""
+    query = sb.table("applications").select(columns, count="exact")
 
     if rep_filter:
         rep_info = get_rep_info(rep_filter)
@@ -1321,39 +1707,110 @@ def api_submissions():
             f"business_legal_name.ilike.{pattern},industry.ilike.{pattern},rep_name.ilike.{pattern}"
         )
 
-    res = query.order("id", desc=True).range(start, end).execute()
+    return query.order("id", desc=True)
+
+@app.route("/api/submissions")
+@admin_required
+def api_submissions():
+    limit, offset = _list_paging_args(100, 1000)
+
+    rep_filter = request.args.get("rep", "").strip()
+    q = request.args.get("q", "").strip()
+
+    # Unfiltered pages are cached and revalidated by ETag: an unchanged page
+    # costs one tiny query and a 304 instead of a full fetch + encode.
+    cache_key = None if (rep_filter or q) else (limit, offset)
+    etag = None
+    if cache_key is not None:
+        hit = _get_cached_submissions_page(cache_key)
+        etag = hit[0] if hit is not None else _submissions_etag(limit, offset)
+        if request.if_none_match.contains(etag):
+            resp = app.response_class(status=304)
+            resp.set_etag(etag)
+            return resp
+        if hit is not None:
+            resp = app.response_class(hit[1], mimetype="application/json")
+            resp.set_etag(etag)
+            return resp
+
+    res = _submissions_page_query(rep_filter, q).range(offset, offset + limit - 1).execute()
+    rows = res.data or []
+    body = orjson.dumps({"rows": rows, "total": res.count or 0})
+    resp = app.response_class(body, mimetype="application/json")
+    if cache_key is not None:
+        _store_submissions_page(cache_key, etag, body)
+        resp.set_etag(etag)
+    return resp
+
+@app.route("/api/submissions/full")
+@admin_required
+def api_submissions_full():
+    """A page of submissions with their files attached, in three round-trips
+    total (page, files via IN, one batch of signed URLs) instead of a detail
+    call per row. Takes the same limit/offset/rep/q args as /api/submissions."""
+    limit, offset = _list_paging_args(25, 100)
+    rep_filter = request.args.get("rep", "").strip()
+    q = request.args.get("q", "").strip()
+
+    res = _submissions_page_query(
+        rep_filter, q, _SUBMISSION_DETAIL_COLUMNS
+    ).range(offset, offset + limit - 1).execute()
     rows = res.data or []
+    by_app: dict = {}
     for r in rows:
-        if r.get("loan_amount") is not None:
-            r["loan_amount"] = float(r["loan_amount"])
-    return jsonify({"rows": rows, "total": res.count or 0})
+        r["files"] = by_app[r["id"]] = []
+
+    if by_app:
+        files_res = sb.table("application_files").select(
+            "id, application_id, filename, storage_path, size_bytes, doc_type"
+        ).in_("application_id", list(by_app)).order("id").execute()
+        files = files_res.data or []
+        try:
+            urls = _get_signed_urls([f["storage_path"] for f in files])
+        except Exception as e:
+            log.error("Failed to generate signed URLs for submissions page: %s", e)
+            urls = {}
+        for f in files:
+            f["url"] = urls.get(f["storage_path"], "")
+            by_app[f.pop("application_id")].append(f)
+
+    return _json_response({"rows": rows, "total": res.count or 0})
 
 @app.route("/api/submissions/<int:sid>")
 @admin_required
 def api_submission_detail(sid: int):
-    app_res = sb.table("applications").select(
-        "id, created_at, business_legal_name, industry, loan_amount, owners, payload, company_website, rep_name, rep_email"
-    ).eq("id", sid).execute()
+    hit = _get_cached_detail(sid)
+    if hit is not None and hit[0] == _current_files_fingerprint(sid):
+        return app.response_class(hit[1], mimetype="application/json")
+
+    app_res = sb.table("applications").select(_SUBMISSION_DETAIL_COLUMNS).eq("id", sid).execute()
     rows = app_res.data or []
     if not rows:
         abort(404)
     app_row = rows[0]
-    if app_row.get("loan_amount") is not None:
-        app_row["loan_amount"] = float(app_row["loan_amount"])
 
     files_res = sb.table("application_files").select(
         "id, filename, storage_path, size_bytes, doc_type"
     ).eq("application_id", sid).execute()
     files = files_res.data or []
+    try:
+        urls = _get_signed_urls([f["storage_path"] for f in files])
+    except Exception as e:
+        log.error("Failed to generate signed URLs for submission %s: %s", sid, e)
+        urls = {}
+    signed_all = True
     for f in files:
-        try:
-            f["url"] = _get_signed_url(f["storage_path"])
-        except Exception as e:
-            log.error("Failed to generate signed URL for %s: %s", f["storage_path"], e)
-            f["url"] = ""
+        f["url"] = url = urls.get(f["storage_path"], "")
+        if not url:
+            signed_all = False
 
     app_row["files"] = files
-    return jsonify(app_row)
+    body = orjson.dumps(app_row)
+    if signed_all:
+        # Don't pin a missing link for the whole TTL; retry on the next view.
+        fingerprint = _files_fingerprint(max((f["id"] for f in files), default=0), len(files))
+        _store_detail(sid, fingerprint, body)
+    return app.response_class(body, mimetype="application/json")
 
 _REP_CODE_RE = re.compile(r"^[a-z0-9][a-z0-9_-]{0,63}$")
 _EMAIL_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
@@ -1390,7 +1847,13 @@ def _validate_rep_payload(data: dict, *, require_code: bool) -> tuple[Optional[d
 @admin_required
 def api_csrf_token():
     """Lets static admin pages (dashboard.html, rep-links.html) get a CSRF token for write requests."""
-    return jsonify({"token": generate_csrf()})
+    return _json_response({"token": generate_csrf()})
+
+# Encoded /api/reps bodies, keyed by (base_url, include_inactive). Each entry
+# remembers the rep snapshot it was built from; a reload or
+# _invalidate_rep_cache() swaps that dict out, so stale bodies are never served.
+_REPS_BODY_MAX = 16  # base_url comes from the Host header
+_reps_body_cache: dict = {}  # key -> (reps snapshot, body)
 
 @app.route("/api/reps", methods=["GET"])
 @admin_required
@@ -1398,11 +1861,17 @@ def api_reps():
     """List sales reps with their unique links. Includes inactive by default for admin view."""
     include_inactive = request.args.get("include_inactive", "1") != "0"
     base_url = request.host_url.rstrip("/")
-    reps = list(_get_reps_cached().values())
+    snapshot = _get_reps_cached()
+    key = (base_url, include_inactive)
+    hit = _reps_body_cache.get(key)
+    if hit is not None and hit[0] is snapshot:
+        return app.response_class(hit[1], mimetype="application/json")
+
+    reps = list(snapshot.values())
     if not include_inactive:
         reps = [r for r in reps if r.get("active", True)]
     reps.sort(key=lambda r: (not r.get("active", True), r["code"]))
-    return jsonify([
+    body = orjson.dumps([
         {
             "code": r["code"],
             "name": r["name"],
@@ -1412,16 +1881,20 @@ def api_reps():
         }
         for r in reps
     ])
+    if len(_reps_body_cache) >= _REPS_BODY_MAX:
+        _reps_body_cache.clear()
+    _reps_body_cache[key] = (snapshot, body)
+    return app.response_class(body, mimetype="application/json")
 
 @app.route("/api/reps", methods=["POST"])
 @admin_required
 def api_reps_create():
     clean, err = _validate_rep_payload(request.get_json(silent=True) or {}, require_code=True)
     if err:
-        return jsonify({"error": err}), 400
+        return _json_response({"error": err}, 400)
     existing = _get_reps_cached().get(clean["code"])
     if existing:
-        return jsonify({"error": f"Rep code '{clean['code']}' already exists."}), 409
+        return _json_response({"error": f"Rep code '{clean['code']}' already exists."}, 409)
     try:
         sb.table("sales_reps").insert({
             "code": clean["code"],
@@ -1431,29 +1904,29 @@ def api_reps_create():
         }).execute()
     except Exception as e:
         log.warning("Rep insert failed: %s", e)
-        return jsonify({"error": "Failed to create rep."}), 500
+        return _json_response({"error": "Failed to create rep."}, 500)
     _invalidate_rep_cache()
-    return jsonify({"ok": True, "code": clean["code"]}), 201
+    return _json_response({"ok": True, "code": clean["code"]}, 201)
 
 @app.route("/api/reps/<code>", methods=["PATCH"])
 @admin_required
 def api_reps_update(code: str):
     code = code.lower().strip()
     if not _get_reps_cached().get(code):
-        return jsonify({"error": "Rep not found."}), 404
+        return _json_response({"error": "Rep not found."}, 404)
     clean, err = _validate_rep_payload(request.get_json(silent=True) or {}, require_code=False)
     if err:
-        return jsonify({"error": err}), 400
+        return _json_response({"error": err}, 400)
     clean.pop("code", None)
     if not clean:
-        return jsonify({"error": "No fields to update."}), 400
+        return _json_response({"error": "No fields to update."}, 400)
     try:
         sb.table("sales_reps").update(clean).eq("code", code).execute()
     except Exception as e:
         log.warning("Rep update failed: %s", e)
-        return jsonify({"error": "Failed to update rep."}), 500
+        return _json_response({"error": "Failed to update rep."}, 500)
     _invalidate_rep_cache()
-    return jsonify({"ok": True})
+    return _json_response({"ok": True})
 
 @app.route("/api/reps/<code>", methods=["DELETE"])
 @admin_required
@@ -1461,14 +1934,14 @@ def api_reps_deactivate(code: str):
     """Soft-delete: set active=false so historical submissions remain attributable."""
     code = code.lower().strip()
     if not _get_reps_cached().get(code):
-        return jsonify({"error": "Rep not found."}), 404
+        return _json_response({"error": "Rep not found."}, 404)
     try:
         sb.table("sales_reps").update({"active": False}).eq("code", code).execute()
     except Exception as e:
         log.warning("Rep deactivate failed: %s", e)
-        return jsonify({"error": "Failed to deactivate rep."}), 500
+        return _json_response({"error": "Failed to deactivate rep."}, 500)
     _invalidate_rep_cache()
-    return jsonify({"ok": True})
+    return _json_response({"ok": True})
 
 # -------------------- Admin Login --------------------
 @app.route("/login", methods=["GET", "POST"])
@@ -1501,15 +1974,27 @@ def logout():
     return redirect(url_for("login"))
 
 # Admin dashboard pages
+_PUBLIC_DIR = APP_DIR / "public"
+
+@lru_cache(maxsize=8)
+def _read_public_page(name: str, mtime_ns: int) -> bytes:
+    # mtime is part of the key so an edited file is picked up on the next request.
+    return (_PUBLIC_DIR / name).read_bytes()
+
+def _public_page(name: str):
+    """Serve a small static admin page from memory; one stat() per request instead of open + read."""
+    body = _read_public_page(name, (_PUBLIC_DIR / name).stat().st_mtime_ns)
+    return app.response_class(body, mimetype="text/html")
+
 @app.route("/admin")
 @admin_required
 def admin_static_dashboard():
-    return send_from_directory(str(APP_DIR / "public"), "dashboard.html")
+    return _public_page("dashboard.html")
 
 @app.route("/admin/reps")
 @admin_required
 def admin_rep_links():
-    return send_from_directory(str(APP_DIR / "public"), "rep-links.html")
+    return _public_page("rep-links.html")
 
 # Cache-control: discourage going back to a stale form after Thank You
 @app.after_request
@@ -1525,4 +2010,5 @@ def add_no_store_headers(resp):
 
 if __name__ == "__main__":
     port = int(os.environ.get("PORT", "8000"))
-    app.run(host="0.0.0.0", port=port, debug=True)
+    # Local dev server only; production runs under gunicorn (see railway.toml).
+    app.run(host="0.0.0.0", port=port, debug=os.environ.get("FLASK_DEBUG") == "1")